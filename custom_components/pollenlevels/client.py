@@ -10,12 +10,23 @@ from aiohttp import ClientError, ClientSession, ClientTimeout, ContentTypeError
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
-
-from .const import MAX_RETRIES, POLLEN_API_TIMEOUT, is_invalid_api_key_message
+from homeassistant.util.json import json_loads
+
+from .const import (
+    MAX_RETRIES,
+    POLLEN_API_TIMEOUT,
+    POLLEN_API_URL,
+    is_invalid_api_key_message,
+)
 from .util import extract_error_message, redact_sensitive_values
 
 _LOGGER = logging.getLogger(__name__)
 
+# ClientTimeout is immutable; share one instance across all requests.
+_REQUEST_TIMEOUT = ClientTimeout(total=POLLEN_API_TIMEOUT)
+# Exponential backoff bases (0.8s, 1.6s, ...) indexed by retry attempt.
+_BACKOFF_BASE_DELAYS = tuple(0.8 * (2**attempt) for attempt in range(MAX_RETRIES))
+
 
 def _format_http_message(status: int, raw_message: str | None) -> str:
     """Format an HTTP status and optional message consistently."""
@@ -26,6 +37,12 @@ def _format_http_message(status: int, raw_message: str | None) -> str:
     return f"HTTP {status}"
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Return the jittered exponential backoff delay for a retry attempt."""
+
+    return _BACKOFF_BASE_DELAYS[attempt] + random.random() * 0.3
+
+
 def _raise_auth_failed_if_invalid_api_key(
     raw_message: str | None, formatted_message: str
 ) -> None:
@@ -67,20 +84,6 @@ class GooglePollenApiClient:
 
         return 2.0
 
-    async def _async_backoff(
-        self,
-        *,
-        attempt: int,
-        max_retries: int,
-        message: str,
-        base_args: tuple[Any, ...] = (),
-    ) -> None:
-        """Log a retry warning with jittered backoff and sleep."""
-
-        delay = 0.8 * (2**attempt) + random.uniform(0.0, 0.3)
-        _LOGGER.warning(message, *base_args, delay, attempt + 1, max_retries)
-        await asyncio.sleep(delay)
-
     def _redact_sensitive_message(
         self,
         value: object,
@@ -124,27 +127,34 @@ class GooglePollenApiClient:
     ) -> dict[str, Any]:
         """Perform the HTTP call and return the decoded payload."""
 
-        url = "https://pollen.googleapis.com/v1/forecast:lookup"
-        params = {
-            "key": self._api_key,
-            "location.latitude": f"{latitude:.6f}",
-            "location.longitude": f"{longitude:.6f}",
-            "days": days,
-        }
+        # aiohttp accepts a sequence of pairs and only iterates it, so skip
+        # building a dict that would just be hashed and walked once.
+        params: list[tuple[str, str | int]] = [
+            ("key", self._api_key),
+            ("location.latitude", f"{latitude:.6f}"),
+            ("location.longitude", f"{longitude:.6f}"),
+            ("days", days),
+        ]
         if language_code:
-            params["languageCode"] = language_code
+            params.append(("languageCode", language_code))
 
         _LOGGER.debug(
             "Fetching forecast (days=%s, lang_set=%s)", days, bool(language_code)
         )
 
         max_retries = MAX_RETRIES
+        # Every retry sleeps at the top of the next attempt, after the response
+        # context (if any) has released its pooled connection.
+        retry_delay: float | None = None
         for attempt in range(0, max_retries + 1):
+            if retry_delay is not None:
+                await asyncio.sleep(retry_delay)
+                retry_delay = None
             try:
                 async with self._session.get(
-                    url,
+                    POLLEN_API_URL,
                     params=params,
-                    timeout=ClientTimeout(total=POLLEN_API_TIMEOUT),
+                    timeout=_REQUEST_TIMEOUT,
                 ) as resp:
                     if resp.status == 401:
                         _, message = await self._async_redacted_http_message(
@@ -179,7 +189,7 @@ class GooglePollenApiClient:
                                 attempt + 1,
                                 max_retries,
                             )
-                            await asyncio.sleep(delay)
+                            retry_delay = delay
                             continue
                         _, message = await self._async_redacted_http_message(
                             resp,
@@ -191,14 +201,14 @@ class GooglePollenApiClient:
 
                     if 500 <= resp.status <= 599:
                         if attempt < max_retries:
-                            await self._async_backoff(
-                                attempt=attempt,
-                                max_retries=max_retries,
-                                message=(
-                                    "Pollen API HTTP %s — retrying in %.2fs "
-                                    "(attempt %d/%d)"
-                                ),
-                                base_args=(resp.status,),
+                            retry_delay = _backoff_delay(attempt)
+                            _LOGGER.warning(
+                                "Pollen API HTTP %s — retrying in %.2fs "
+                                "(attempt %d/%d)",
+                                resp.status,
+                                retry_delay,
+                                attempt + 1,
+                                max_retries,
                             )
                             continue
                         _, message = await self._async_redacted_http_message(
@@ -230,7 +240,11 @@ class GooglePollenApiClient:
 
                     try:
                         try:
-                            payload = await resp.json(content_type=None)
+                            # Home Assistant's orjson-backed json_loads parses the
+                            # decoded text faster than the stdlib json.loads.
+                            payload = await resp.json(
+                                content_type=None, loads=json_loads
+                            )
                         except TypeError:
                             payload = await resp.json()
                     except (ContentTypeError, TypeError, ValueError) as err:
@@ -245,16 +259,16 @@ class GooglePollenApiClient:
 
                     return payload
 
-            except ConfigEntryAuthFailed:
+            except ConfigEntryAuthFailed, UpdateFailed:
                 raise
             except TimeoutError as err:
                 if attempt < max_retries:
-                    await self._async_backoff(
-                        attempt=attempt,
-                        max_retries=max_retries,
-                        message=(
-                            "Pollen API timeout — retrying in %.2fs (attempt %d/%d)"
-                        ),
+                    retry_delay = _backoff_delay(attempt)
+                    _LOGGER.warning(
+                        "Pollen API timeout — retrying in %.2fs (attempt %d/%d)",
+                        retry_delay,
+                        attempt + 1,
+                        max_retries,
                     )
                     continue
                 msg = (
@@ -266,13 +280,13 @@ class GooglePollenApiClient:
                 raise UpdateFailed(f"Timeout: {msg}") from err
             except ClientError as err:
                 if attempt < max_retries:
-                    await self._async_backoff(
-                        attempt=attempt,
-                        max_retries=max_retries,
-                        message=(
-                            "Network error to Pollen API — retrying in %.2fs "
-                            "(attempt %d/%d)"
-                        ),
+                    retry_delay = _backoff_delay(attempt)
+                    _LOGGER.warning(
+                        "Network error to Pollen API — retrying in %.2fs "
+                        "(attempt %d/%d)",
+                        retry_delay,
+                        attempt + 1,
+                        max_retries,
                     )
                     continue
                 msg = (
@@ -282,8 +296,6 @@ class GooglePollenApiClient:
                     or "Network error while calling the Google Pollen API"
                 )
                 raise UpdateFailed(msg) from err
-            except UpdateFailed:
-                raise
             except Exception as err:  # noqa: BLE001
                 msg = self._redact_sensitive_message(
                     err, latitude=latitude, longitude=longitude
@@ -56,7 +56,6 @@ from .util import (
     entry_api_key,
     format_location_unique_id,
     normalize_language_code,
-    redact_api_key,
     redact_sensitive_values,
     safe_parse_int,
     strip_legacy_forecast_options,
@@ -67,6 +66,25 @@ from .util import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bare "HTTP <status>" messages carry no detail worth showing in the form.
+_HTTP_429_ONLY_FULLMATCH = re.compile(r"HTTP\s+429:?", re.IGNORECASE).fullmatch
+_HTTP_STATUS_ONLY_FULLMATCH = re.compile(r"HTTP\s+\d+:?", re.IGNORECASE).fullmatch
+
+# Selectors carry no per-render state, so build them once and share them across
+# every schema; only the defaults change between form renders.
+_API_KEY_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+_LANGUAGE_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
+_LOCATION_SELECTOR = LocationSelector(LocationSelectorConfig(radius=False))
+_UPDATE_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=MIN_UPDATE_INTERVAL_HOURS,
+        max=MAX_UPDATE_INTERVAL_HOURS,
+        step=1,
+        mode=NumberSelectorMode.BOX,
+        unit_of_measurement="h",
+    )
+)
+
 
 def is_valid_language_code(value: str) -> str:
     """Validate language code format; return normalized (trimmed) value."""
@@ -169,6 +187,11 @@ def _daily_info_is_valid(data: Any) -> bool:
     return has_usable_entry
 
 
+def _api_key_is_well_formed(api_key: str) -> bool:
+    """Return whether *api_key* could be a real key (no spaces or control chars)."""
+    return api_key.isprintable() and not any(char.isspace() for char in api_key)
+
+
 async def _async_validate_api_location(
     hass: Any,
     *,
@@ -180,6 +203,16 @@ async def _async_validate_api_location(
     description_placeholders: dict[str, Any],
 ) -> bool:
     """Validate that the API key can fetch pollen data for one location."""
+    if not _api_key_is_well_formed(api_key):
+        # Pasted keys with embedded whitespace or control characters can never
+        # authenticate, so skip the network round-trip entirely.
+        _LOGGER.debug("Validation: API key contains whitespace or control chars")
+        errors["base"] = "invalid_auth"
+        # The localized invalid_auth text already explains the error; keep its
+        # {error_message} placeholder empty instead of adding English detail.
+        description_placeholders["error_message"] = ""
+        return False
+
     try:
         session = async_get_clientsession(hass)
         client = GooglePollenApiClient(session=session, api_key=api_key)
@@ -210,7 +243,7 @@ async def _async_validate_api_location(
     except PollenQuotaExceededError as err:
         errors["base"] = "quota_exceeded"
         redacted = _redact_validation_error(err, api_key, latitude, longitude)
-        if re.fullmatch(r"HTTP\s+429(?::)?", redacted, flags=re.IGNORECASE):
+        if _HTTP_429_ONLY_FULLMATCH(redacted):
             redacted = ""
         description_placeholders["error_message"] = _safe_error_message(
             redacted, "Quota exceeded."
@@ -218,28 +251,22 @@ async def _async_validate_api_location(
     except UpdateFailed as err:
         errors["base"] = "cannot_connect"
         redacted = _redact_validation_error(err, api_key, latitude, longitude)
-        if re.fullmatch(r"HTTP\s+\d+(?::)?", redacted, flags=re.IGNORECASE):
+        if _HTTP_STATUS_ONLY_FULLMATCH(redacted):
             redacted = ""
         description_placeholders["error_message"] = _safe_error_message(
             redacted, "Failed to connect to the pollen service."
         )
     except TimeoutError as err:
-        _LOGGER.warning(
-            "Validation timeout: %s",
-            _redact_validation_error(err, api_key, latitude, longitude),
-        )
-        errors["base"] = "cannot_connect"
         redacted = _redact_validation_error(err, api_key, latitude, longitude)
+        _LOGGER.warning("Validation timeout: %s", redacted)
+        errors["base"] = "cannot_connect"
         description_placeholders["error_message"] = _safe_error_message(
             redacted, "Validation request timed out."
         )
     except aiohttp.ClientError as err:
-        _LOGGER.error(
-            "Connection error: %s",
-            _redact_validation_error(err, api_key, latitude, longitude),
-        )
-        errors["base"] = "cannot_connect"
         redacted = _redact_validation_error(err, api_key, latitude, longitude)
+        _LOGGER.error("Connection error: %s", redacted)
+        errors["base"] = "cannot_connect"
         description_placeholders["error_message"] = _safe_error_message(
             redacted, "Network error while connecting to the pollen service."
         )
@@ -286,29 +313,19 @@ def _build_step_user_schema(hass: Any, user_input: dict[str, Any] | None) -> vol
 
     schema = vol.Schema(
         {
-            vol.Required(CONF_API_KEY): TextSelector(
-                TextSelectorConfig(type=TextSelectorType.PASSWORD)
-            ),
+            vol.Required(CONF_API_KEY): _API_KEY_SELECTOR,
             vol.Required(CONF_NAME, default=default_name): str,
-            location_field: LocationSelector(LocationSelectorConfig(radius=False)),
+            location_field: _LOCATION_SELECTOR,
             vol.Optional(
                 CONF_UPDATE_INTERVAL,
                 default=interval_default,
-            ): NumberSelector(
-                NumberSelectorConfig(
-                    min=MIN_UPDATE_INTERVAL_HOURS,
-                    max=MAX_UPDATE_INTERVAL_HOURS,
-                    step=1,
-                    mode=NumberSelectorMode.BOX,
-                    unit_of_measurement="h",
-                )
-            ),
+            ): _UPDATE_INTERVAL_SELECTOR,
             vol.Optional(
                 CONF_LANGUAGE_CODE,
                 default=user_input.get(
                     CONF_LANGUAGE_CODE, getattr(hass.config, "language", "")
                 ),
-            ): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
+            ): _LANGUAGE_SELECTOR,
         }
     )
     return schema
@@ -346,7 +363,7 @@ def _build_location_subentry_schema(
     return vol.Schema(
         {
             vol.Required(CONF_NAME, default=default_name): str,
-            location_field: LocationSelector(LocationSelectorConfig(radius=False)),
+            location_field: _LOCATION_SELECTOR,
         }
     )
 
@@ -437,11 +454,13 @@ def _location_data_for_validation(
     return []
 
 
+# Base errors that may be specific to one location rather than the API key.
+_LOCATION_SPECIFIC_ERRORS = frozenset({"invalid_coordinates", "cannot_connect"})
+
+
 def _should_try_next_location(errors: dict[str, str]) -> bool:
     """Return whether validation failure may be specific to one location."""
-    if errors == {"base": "invalid_coordinates"}:
-        return True
-    return errors == {"base": "cannot_connect"}
+    return len(errors) == 1 and errors.get("base") in _LOCATION_SPECIFIC_ERRORS
 
 
 def _has_duplicate_location(
@@ -468,6 +487,16 @@ def _entry_for_parent_unique_id(
     return hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_id)
 
 
+def _api_key_used_by_other_entry(
+    hass: Any, entry: config_entries.ConfigEntry, unique_id: str
+) -> bool:
+    """Return whether a different parent entry already owns this API key."""
+    existing_entry = _entry_for_parent_unique_id(hass, unique_id)
+    return existing_entry is not None and getattr(
+        existing_entry, "entry_id", None
+    ) != getattr(entry, "entry_id", None)
+
+
 async def _async_reload_parent_after_subentry_create(hass: Any, entry_id: str) -> None:
     """Reload the parent after Home Assistant persists the created subentry."""
     # Let Home Assistant finish attaching the newly-created subentry before reload.
@@ -637,19 +666,23 @@ class PollenLevelsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input:
             sanitized_input: dict[str, Any] = dict(user_input)
 
+            # Reject an already configured key before spending an API call on it.
+            api_key = str(user_input.get(CONF_API_KEY, "")).strip()
+            parent_unique_id = _api_key_unique_id(api_key) if api_key else None
+            if parent_unique_id is not None:
+                await self.async_set_unique_id(
+                    parent_unique_id, raise_on_progress=False
+                )
+                if _entry_for_parent_unique_id(self.hass, parent_unique_id) is not None:
+                    return self.async_abort(reason="api_key_already_configured")
+
             errors, normalized = await self._async_validate_input(
                 sanitized_input,
                 description_placeholders=description_placeholders,
             )
             if not errors and normalized is not None:
-                await self.async_set_unique_id(
-                    _api_key_unique_id(normalized[CONF_API_KEY]),
-                    raise_on_progress=False,
-                )
-                existing_entry = _entry_for_parent_unique_id(
-                    self.hass, _api_key_unique_id(normalized[CONF_API_KEY])
-                )
-                if existing_entry is not None:
+                # Another flow may have added the same key while validating.
+                if _entry_for_parent_unique_id(self.hass, parent_unique_id) is not None:
                     return self.async_abort(reason="api_key_already_configured")
                 entry_name = str(user_input.get(CONF_NAME, "")).strip()
                 title = entry_name or DEFAULT_ENTRY_TITLE
@@ -702,26 +735,23 @@ class PollenLevelsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input:
             location_candidates = _location_data_for_validation(entry)
-            if not location_candidates:
-                updated_api_key = str(user_input.get(CONF_API_KEY, "")).strip()
-                if not updated_api_key:
+            updated_api_key = str(user_input.get(CONF_API_KEY, "")).strip()
+            if not updated_api_key:
+                if not location_candidates:
                     errors[CONF_API_KEY] = "empty"
-                else:
-                    updated_unique_id = _api_key_unique_id(updated_api_key)
-                    existing_entry = _entry_for_parent_unique_id(
-                        self.hass, updated_unique_id
-                    )
-                    if existing_entry is not None and getattr(
-                        existing_entry, "entry_id", None
-                    ) != getattr(entry, "entry_id", None):
-                        errors = {"base": "api_key_already_configured"}
-                    else:
-                        return self.async_update_reload_and_abort(
-                            entry,
-                            data_updates={CONF_API_KEY: updated_api_key},
-                            unique_id=updated_unique_id,
-                            reason=success_reason,
-                        )
+            elif _api_key_used_by_other_entry(
+                self.hass, entry, _api_key_unique_id(updated_api_key)
+            ):
+                # Reject another parent's key before validating any location.
+                errors = {"base": "api_key_already_configured"}
+                location_candidates = []
+            elif not location_candidates:
+                return self.async_update_reload_and_abort(
+                    entry,
+                    data_updates={CONF_API_KEY: updated_api_key},
+                    unique_id=_api_key_unique_id(updated_api_key),
+                    reason=success_reason,
+                )
 
             display_errors: dict[str, str] | None = None
             display_placeholders: dict[str, Any] | None = None
@@ -745,14 +775,12 @@ class PollenLevelsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     description_placeholders=candidate_placeholders,
                 )
                 if not errors and normalized is not None:
-                    updated_api_key = str(normalized.get(CONF_API_KEY, "")).strip()
+                    updated_api_key = normalized[CONF_API_KEY]
                     updated_unique_id = _api_key_unique_id(updated_api_key)
-                    existing_entry = _entry_for_parent_unique_id(
-                        self.hass, updated_unique_id
-                    )
-                    if existing_entry is not None and getattr(
-                        existing_entry, "entry_id", None
-                    ) != getattr(entry, "entry_id", None):
+                    # Another flow may have claimed the key while validating.
+                    if _api_key_used_by_other_entry(
+                        self.hass, entry, updated_unique_id
+                    ):
                         errors = {"base": "api_key_already_configured"}
                         display_errors = errors
                         display_placeholders = candidate_placeholders
@@ -781,7 +809,7 @@ class PollenLevelsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(
                     CONF_API_KEY,
                     default="",
-                ): TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+                ): _API_KEY_SELECTOR
             }
         )
 
@@ -960,32 +988,21 @@ class PollenLevelsOptionsFlow(config_entries.OptionsFlowWithReload):
         errors: dict[str, str] = {}
         placeholders = {"title": self.config_entry.title or DEFAULT_ENTRY_TITLE}
 
-        current_interval_raw = self.config_entry.options.get(
-            CONF_UPDATE_INTERVAL,
-            self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
-        )
-        current_interval = _sanitize_update_interval_for_default(current_interval_raw)
-        current_lang = self.config_entry.options.get(
-            CONF_LANGUAGE_CODE,
-            self.config_entry.data.get(CONF_LANGUAGE_CODE, self.hass.config.language),
+        # Options override data; resolve the precedence once for all lookups.
+        current = {**self.config_entry.data, **self.config_entry.options}
+        current_interval = _sanitize_update_interval_for_default(
+            current.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         )
+        current_lang = current.get(CONF_LANGUAGE_CODE, self.hass.config.language)
 
         options_schema = vol.Schema(
             {
                 vol.Optional(
                     CONF_UPDATE_INTERVAL, default=current_interval
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=MIN_UPDATE_INTERVAL_HOURS,
-                        max=MAX_UPDATE_INTERVAL_HOURS,
-                        step=1,
-                        mode=NumberSelectorMode.BOX,
-                        unit_of_measurement="h",
-                    )
-                ),
-                vol.Optional(CONF_LANGUAGE_CODE, default=current_lang): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
+                ): _UPDATE_INTERVAL_SELECTOR,
+                vol.Optional(
+                    CONF_LANGUAGE_CODE, default=current_lang
+                ): _LANGUAGE_SELECTOR,
             }
         )
 
@@ -1013,11 +1030,7 @@ class PollenLevelsOptionsFlow(config_entries.OptionsFlowWithReload):
 
             try:
                 raw_lang = normalized_input.get(
-                    CONF_LANGUAGE_CODE,
-                    self.config_entry.options.get(
-                        CONF_LANGUAGE_CODE,
-                        self.config_entry.data.get(CONF_LANGUAGE_CODE, ""),
-                    ),
+                    CONF_LANGUAGE_CODE, current.get(CONF_LANGUAGE_CODE, "")
                 )
                 lang = raw_lang.strip() if isinstance(raw_lang, str) else ""
                 if lang:
@@ -1030,12 +1043,6 @@ class PollenLevelsOptionsFlow(config_entries.OptionsFlowWithReload):
                     _language_error_to_form_key(ve),
                 )
                 errors[CONF_LANGUAGE_CODE] = _language_error_to_form_key(ve)
-            except Exception as err:  # defensive
-                _LOGGER.exception(
-                    "Options validation error: %s",
-                    redact_api_key(err, self.config_entry.data.get(CONF_API_KEY)),
-                )
-                errors["base"] = "unknown"
 
             if not errors:
                 return self.async_create_entry(title="", data=normalized_input)
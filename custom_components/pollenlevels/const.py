@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 # Define constants for Pollen Levels integration
 
 DOMAIN = "pollenlevels"
@@ -22,6 +24,7 @@ DEFAULT_UPDATE_INTERVAL = 6
 MIN_UPDATE_INTERVAL_HOURS = 1
 MAX_UPDATE_INTERVAL_HOURS = 24
 DEFAULT_ENTRY_TITLE = "Pollen Levels"
+POLLEN_API_URL = "https://pollen.googleapis.com/v1/forecast:lookup"
 POLLEN_API_TIMEOUT = 10
 MAX_RETRIES = 1
 POLLEN_API_KEY_URL = (
@@ -35,19 +38,25 @@ ATTRIBUTION = "Google Maps — Source: Includes pollen data from Google"
 SUBENTRY_TYPE_LOCATION = "location"
 
 
+_INVALID_API_KEY_SIGNALS = (
+    "api key not valid",
+    "invalid api key",
+    "api_key_invalid",
+    "apikeynotvalid",
+    "api key is not valid",
+    "api key expired",
+)
+# One case-insensitive pass over the message instead of casefold() plus a
+# substring scan per signal.
+_INVALID_API_KEY_RE = re.compile(
+    "|".join(map(re.escape, _INVALID_API_KEY_SIGNALS)), re.IGNORECASE
+)
+
+
 def is_invalid_api_key_message(message: str | None) -> bool:
     """Return True if *message* strongly indicates an invalid API key."""
 
     if not message:
         return False
 
-    msg = message.casefold()
-    signals = (
-        "api key not valid",
-        "invalid api key",
-        "api_key_invalid",
-        "apikeynotvalid",
-        "api key is not valid",
-        "api key expired",
-    )
-    return any(signal in msg for signal in signals)
+    return _INVALID_API_KEY_RE.search(message) is not None
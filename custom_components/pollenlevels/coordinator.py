@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import math
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -32,6 +33,18 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 STALE_DATA_TTL = timedelta(hours=24)
+# Attributes of a type sensor that has forecast data but no current-day entry.
+_TYPE_SKELETON_KEYS = (
+    "source",
+    "displayName",
+    "inSeason",
+    "advice",
+    "value",
+    "category",
+    "description",
+    "color_hex",
+    "color_rgb",
+)
 
 
 def _normalize_channel(v: Any) -> int | None:
@@ -47,11 +60,13 @@ def _normalize_channel(v: Any) -> int | None:
         return None
     if 0.0 <= f <= 1.0:
         f *= 255.0
-    return max(0, min(255, int(round(f))))
+    # round() on a float already returns an int; clamp without max()/min() calls.
+    i = round(f)
+    return 0 if i < 0 else 255 if i > 255 else i
 
 
-def _rgb_from_api(color: dict[str, Any] | None) -> tuple[int, int, int] | None:
-    """Build an (R, G, B) tuple from API color dict.
+def _rgb_from_api(color: dict[str, Any] | None) -> list[int] | None:
+    """Build an [R, G, B] list from API color dict.
 
     Rules:
     - If color is not a dict, or an empty dict, return None
@@ -72,17 +87,25 @@ def _rgb_from_api(color: dict[str, Any] | None) -> tuple[int, int, int] | None:
         return None
 
     # Replace missing channels with 0 (only when at least one exists)
-    return (r or 0, g or 0, b or 0)
+    return [r or 0, g or 0, b or 0]
 
 
-def _rgb_to_hex_triplet(rgb: tuple[int, int, int] | None) -> str | None:
-    """Convert (R,G,B) 0..255 to #RRGGBB."""
-    if rgb is None:
-        return None
-    r, g, b = rgb
+@functools.lru_cache(maxsize=256)
+def _hex_triplet(r: int, g: int, b: int) -> str:
+    """Return ``#RRGGBB`` for 0..255 channels; the API palette is small."""
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+def _color_from_api(
+    color: dict[str, Any] | None,
+) -> tuple[list[int] | None, str | None]:
+    """Return the ``color_rgb`` list and ``#RRGGBB`` hex for an API color dict."""
+    rgb = _rgb_from_api(color)
+    if rgb is None:
+        return None, None
+    return rgb, _hex_triplet(*rgb)
+
+
 def _normalize_plant_code(code: Any) -> str:
     """Normalize plant code for cross-day map lookups."""
     if code is None:
@@ -91,7 +114,10 @@ def _normalize_plant_code(code: Any) -> str:
 
 
 def _extract_api_date(day: dict[str, Any]) -> str | None:
-    """Extract a YYYY-MM-DD date string from one API dailyInfo item."""
+    """Extract a YYYY-MM-DD date string from one API dailyInfo item.
+
+    Returns None when the date is missing or not a real calendar date.
+    """
     date_obj = day.get("date") or {}
     if not isinstance(date_obj, dict):
         return None
@@ -101,41 +127,48 @@ def _extract_api_date(day: dict[str, Any]) -> str | None:
     day_num = safe_parse_int(date_obj.get("day"))
     if year is None or month is None or day_num is None:
         return None
-    return f"{year:04d}-{month:02d}-{day_num:02d}"
+    try:
+        return date(year, month, day_num).isoformat()
+    except ValueError, OverflowError:
+        return None
+
+
+def _index_info(item: dict[str, Any]) -> dict[str, Any]:
+    """Return the item's ``indexInfo`` dict, or an empty dict when absent."""
+    idx = item.get("indexInfo")
+    return idx if isinstance(idx, dict) else {}
 
 
 def _build_forecast_entry(
-    offset: int, date: str | None, item: dict[str, Any]
+    offset: int, date_str: str | None, item: dict[str, Any]
 ) -> dict[str, Any]:
     """Build one behavior-preserving forecast entry from an API item."""
-    idx_raw = item.get("indexInfo")
-    idx = idx_raw if isinstance(idx_raw, dict) else {}
-    has_index = bool(idx)
-    rgb = _rgb_from_api(idx.get("color")) if has_index else None
+    idx = _index_info(item)
+    # An empty indexInfo yields None for every field, so no has_index guards.
+    color_rgb, color_hex = _color_from_api(idx.get("color"))
     return {
         "offset": offset,
-        "date": date,
-        "has_index": has_index,
-        "value": idx.get("value") if has_index else None,
-        "category": idx.get("category") if has_index else None,
-        "description": idx.get("indexDescription") if has_index else None,
-        "color_hex": _rgb_to_hex_triplet(rgb) if has_index else None,
-        "color_rgb": list(rgb) if (has_index and rgb is not None) else None,
+        "date": date_str,
+        "has_index": bool(idx),
+        "value": idx.get("value"),
+        "category": idx.get("category"),
+        "description": idx.get("indexDescription"),
+        "color_hex": color_hex,
+        "color_rgb": color_rgb,
     }
 
 
 def _build_forecast_list(
-    daily: list[dict[str, Any]],
+    day_dates: list[str | None],
     item_by_day_code: list[dict[str, dict[str, Any]]],
     code: str,
     forecast_days: int,
 ) -> list[dict[str, Any]]:
     """Build forecast entries for one pollen type or plant code."""
     forecast_list: list[dict[str, Any]] = []
-    for offset, day in enumerate(daily[1:], start=1):
+    for offset, date_str in enumerate(day_dates[1:], start=1):
         if offset >= forecast_days:
             break
-        date_str = _extract_api_date(day)
         item = item_by_day_code[offset].get(code) or {}
         forecast_list.append(_build_forecast_entry(offset, date_str, item))
     return forecast_list
@@ -238,11 +271,7 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
                 days=self.forecast_days,
                 language_code=self.language,
             )
-        except ConfigEntryAuthFailed:
-            raise
-        except UpdateFailed:
-            raise
-        except asyncio.CancelledError:
+        except ConfigEntryAuthFailed, UpdateFailed, asyncio.CancelledError:
             raise
         except Exception as err:  # Keep previous behavior for unexpected errors
             msg = redact_sensitive_values(
@@ -293,9 +322,11 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
         self._missing_dailyinfo_warned = False
         self._stale_dailyinfo_warned = False
 
+        # Format each API date once; forecast lists for every code reuse them.
+        day_dates = [_extract_api_date(day) for day in daily]
+
         # date (today)
-        first_day = daily[0]
-        date_str = _extract_api_date(first_day)
+        date_str = day_dates[0]
         if date_str is not None:
             new_data["date"] = {"source": "meta", "value": date_str}
 
@@ -325,9 +356,8 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
         # Current-day TYPES
         for tcode in sorted(type_codes):
             titem = type_by_day_code[0].get(tcode) or {}
-            idx_raw = titem.get("indexInfo")
-            idx = idx_raw if isinstance(idx_raw, dict) else {}
-            rgb = _rgb_from_api(idx.get("color"))
+            idx = _index_info(titem)
+            color_rgb, color_hex = _color_from_api(idx.get("color"))
             key = f"type_{tcode.lower()}"
             new_data[key] = {
                 "source": "type",
@@ -337,11 +367,11 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
                 "inSeason": titem.get("inSeason"),
                 "description": idx.get("indexDescription"),
                 "advice": titem.get("healthRecommendations"),
-                "color_hex": _rgb_to_hex_triplet(rgb),
-                "color_rgb": list(rgb) if rgb is not None else None,
+                "color_hex": color_hex,
+                "color_rgb": color_rgb,
             }
 
-        plant_keys: list[str] = []
+        plant_keys: list[tuple[str, str]] = []
 
         # Current-day PLANTS
         for _norm_code, pitem in sorted(plant_by_day_code[0].items()):
@@ -349,11 +379,10 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
             # so `_norm_code` is guaranteed to be a stable non-empty identifier.
             # We still derive `code` from the raw API field (stripped) for attributes, while
             # using lowercased `code` for the sensor key to keep entity creation deterministic.
-            idx_raw = pitem.get("indexInfo")
-            idx = idx_raw if isinstance(idx_raw, dict) else {}
+            idx = _index_info(pitem)
             desc_raw = pitem.get("plantDescription")
             desc = desc_raw if isinstance(desc_raw, dict) else {}
-            rgb = _rgb_from_api(idx.get("color"))
+            color_rgb, color_hex = _color_from_api(idx.get("color"))
             raw_code = pitem.get("code")
             code = str(raw_code).strip() if raw_code is not None else ""
             key = f"plants_{code.lower()}"
@@ -370,62 +399,48 @@ class PollenDataUpdateCoordinator(DataUpdateCoordinator):
                 "cross_reaction": desc.get("crossReaction"),
                 "description": idx.get("indexDescription"),
                 "advice": pitem.get("healthRecommendations"),
-                "color_hex": _rgb_to_hex_triplet(rgb),
-                "color_rgb": list(rgb) if rgb is not None else None,
+                "color_hex": color_hex,
+                "color_rgb": color_rgb,
                 "picture": desc.get("picture"),
                 "picture_closeup": desc.get("pictureCloseup"),
             }
-            plant_keys.append(key)
+            plant_keys.append((key, _norm_code))
 
         # Forecast for TYPES
         for tcode in sorted(type_codes):
             type_key = f"type_{tcode.lower()}"
             existing = new_data.get(type_key)
-            needs_skeleton = not existing or (
-                existing.get("source") == "type"
-                and existing.get("value") is None
-                and existing.get("category") is None
-                and existing.get("description") is None
-            )
-            base = existing or {}
-            if needs_skeleton:
-                base = {
-                    "source": "type",
-                    "displayName": tcode,
-                    "inSeason": None,
-                    "advice": None,
-                    "value": None,
-                    "category": None,
-                    "description": None,
-                    "color_hex": None,
-                    "color_rgb": None,
-                }
-
-                candidate = None
-                for day_idx, _day_data in enumerate(daily):
-                    candidate = type_by_day_code[day_idx].get(tcode)
+            if existing and (
+                existing.get("value") is not None
+                or existing.get("category") is not None
+                or existing.get("description") is not None
+            ):
+                # Common path: today's entry is populated, attach forecast only.
+                base = existing
+            else:
+                base = dict.fromkeys(_TYPE_SKELETON_KEYS)
+                base["source"] = "type"
+                base["displayName"] = tcode
+
+                for day_types in type_by_day_code:
+                    candidate = day_types.get(tcode)
                     if isinstance(candidate, dict):
                         base["displayName"] = candidate.get("displayName", tcode)
                         base["inSeason"] = candidate.get("inSeason")
                         base["advice"] = candidate.get("healthRecommendations")
                         break
             forecast_list = _build_forecast_list(
-                daily, type_by_day_code, tcode, self.forecast_days
+                day_dates, type_by_day_code, tcode, self.forecast_days
             )
             # Attach common forecast attributes (convenience, trend, expected_peak)
             base = attach_forecast_attributes(base, forecast_list)
             new_data[type_key] = base
 
         # Forecast for PLANTS (attributes only; no per-day plant sensors)
-        for key in plant_keys:
-            base = new_data.get(key) or {}
-            pcode = _normalize_plant_code(base.get("code"))
-            if not pcode:
-                # Safety: skip if for some reason code is missing
-                continue
-
+        for key, pcode in plant_keys:
+            base = new_data[key]
             forecast_list = _build_forecast_list(
-                daily, plant_by_day_code, pcode, self.forecast_days
+                day_dates, plant_by_day_code, pcode, self.forecast_days
             )
 
             # Attach common forecast attributes (convenience, trend, expected_peak)
@@ -13,6 +13,7 @@ No network I/O is performed.
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping
 from typing import Any, cast
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -44,11 +45,13 @@ from .util import (
 # expose only 1-decimal approximate coordinates in support examples so issues
 # can distinguish unsupported areas from integration/API failures without
 # publishing exact location data.
-TO_REDACT = {
-    CONF_API_KEY,
-    CONF_LATITUDE,
-    CONF_LONGITUDE,
-}
+TO_REDACT = frozenset(
+    {
+        CONF_API_KEY,
+        CONF_LATITUDE,
+        CONF_LONGITUDE,
+    }
+)
 
 
 def _iso_or_none(dt_obj: Any) -> str | None:
@@ -75,6 +78,35 @@ def _rounded(value: Any) -> float | None:
     return round(f, 1)
 
 
+def _approximate_location(
+    latitude_rounded: float | None, longitude_rounded: float | None
+) -> dict[str, Any]:
+    """Return the approximate location block from already-rounded coordinates."""
+    return {
+        "label": "approximate_location (rounded)",
+        "latitude_rounded": latitude_rounded,
+        "longitude_rounded": longitude_rounded,
+    }
+
+
+def _request_params_example(
+    redacted_key: str,
+    latitude_rounded: float | None,
+    longitude_rounded: float | None,
+    lang: str | None,
+) -> dict[str, Any]:
+    """Return a support-safe example of the forecast request params."""
+    params: dict[str, Any] = {
+        "key": redacted_key,
+        "location.latitude": latitude_rounded,
+        "location.longitude": longitude_rounded,
+        "days": FORECAST_DAYS,
+    }
+    if lang:
+        params["languageCode"] = lang
+    return params
+
+
 def _redact_diagnostics_text(
     value: Any,
     api_key: str | None,
@@ -95,12 +127,77 @@ def _coordinate_pairs_from_location_subentries(
     coordinate_pairs: list[tuple[Any, Any]] = []
     for subentry_id in active_location_subentry_ids(entry):
         subentry = subentries.get(subentry_id)
-        data = dict(getattr(subentry, "data", {}) or {})
+        data = getattr(subentry, "data", None) or {}
         if CONF_LATITUDE in data or CONF_LONGITUDE in data:
             coordinate_pairs.append((data.get(CONF_LATITUDE), data.get(CONF_LONGITUDE)))
     return coordinate_pairs
 
 
+def _empty_forecast_summary() -> dict[str, Any]:
+    """Return the forecast summary for a coordinator without data."""
+    return {
+        "type": {
+            "total_main": 0,
+            "days": FORECAST_DAYS,
+            "codes": [],
+        },
+        "plant": {
+            "enabled": FORECAST_DAYS >= 2,
+            "days": FORECAST_DAYS,
+            "total": 0,
+            "with_attr": 0,
+            "with_nonempty": 0,
+            "with_trend": 0,
+            "codes": [],
+        },
+    }
+
+
+def _forecast_summary(data_map: dict[str, Any]) -> dict[str, Any]:
+    """Return TYPE and PLANT forecast counters for coordinator data."""
+    summary = _empty_forecast_summary()
+    if not data_map:
+        return summary
+
+    # Classify entries in one pass instead of one comprehension per counter.
+    type_main = 0
+    type_codes: set[str] = set()
+    plant_total = 0
+    plants_with_attr = 0
+    plants_with_nonempty = 0
+    plants_with_trend = 0
+    plant_codes: set[str] = set()
+    for key, value in data_map.items():
+        if not isinstance(value, dict):
+            continue
+        source = value.get("source")
+        if source == "type":
+            if key.endswith(("_d1", "_d2")):
+                continue
+            type_main += 1
+            type_codes.add(key.partition("_")[2].upper())
+        elif source == "plant":
+            plant_total += 1
+            if "forecast" in value:
+                plants_with_attr += 1
+                if value["forecast"]:
+                    plants_with_nonempty += 1
+            if value.get("trend") is not None:
+                plants_with_trend += 1
+            if code := value.get("code"):
+                plant_codes.add(code)
+
+    summary["type"].update(total_main=type_main, codes=sorted(type_codes))
+    summary["plant"].update(
+        total=plant_total,
+        with_attr=plants_with_attr,
+        with_nonempty=plants_with_nonempty,
+        with_trend=plants_with_trend,
+        codes=sorted(plant_codes),
+    )
+    return summary
+
+
 def _coordinator_diagnostics(coordinator: Any) -> dict[str, Any]:
     """Return diagnostics for one location coordinator."""
     coord_info = {
@@ -121,47 +218,10 @@ def _coordinator_diagnostics(coordinator: Any) -> dict[str, Any]:
     coord_info["data_keys_total"] = len(all_keys)
     coord_info["data_keys"] = all_keys[:50]
 
-    forecast_summary: dict[str, Any] = {}
-    daily_summary = _daily_summary(data_map)
-
-    type_main_keys = [
-        k
-        for k, v in data_map.items()
-        if isinstance(v, dict)
-        and v.get("source") == "type"
-        and not k.endswith(("_d1", "_d2"))
-    ]
-    type_codes = sorted({k.split("_", 1)[1].upper() for k in type_main_keys})
-    forecast_summary["type"] = {
-        "total_main": len(type_main_keys),
-        "days": FORECAST_DAYS,
-        "codes": type_codes,
-    }
-
-    plant_items = [
-        v
-        for v in data_map.values()
-        if isinstance(v, dict) and v.get("source") == "plant"
-    ]
-    plant_codes = sorted([v.get("code") for v in plant_items if v.get("code")])
-    plants_with_attr = [v for v in plant_items if "forecast" in v]
-    plants_with_nonempty = [v for v in plant_items if v.get("forecast")]
-    plants_with_trend = [v for v in plant_items if v.get("trend") is not None]
-
-    forecast_summary["plant"] = {
-        "enabled": FORECAST_DAYS >= 2,
-        "days": FORECAST_DAYS,
-        "total": len(plant_items),
-        "with_attr": len(plants_with_attr),
-        "with_nonempty": len(plants_with_nonempty),
-        "with_trend": len(plants_with_trend),
-        "codes": plant_codes,
-    }
-
     return {
         "coordinator": coord_info,
-        "forecast_summary": forecast_summary,
-        "daily_summary": daily_summary,
+        "forecast_summary": _forecast_summary(data_map),
+        "daily_summary": _daily_summary(data_map),
     }
 
 
@@ -190,7 +250,7 @@ def _failed_location_diagnostics(
 
 
 def _coordinate_from_coordinator_or_data(
-    coordinator: Any, data: dict[str, Any], key: str
+    coordinator: Any, data: Mapping[str, Any], key: str
 ) -> Any:
     """Return coordinator coordinate with legacy entry-data fallback."""
     attr = "lat" if key == CONF_LATITUDE else "lon"
@@ -270,8 +330,9 @@ async def async_get_config_entry_diagnostics(
 
     NOTE: This function must not perform any network I/O.
     """
-    options: dict[str, Any] = dict(entry.options or {})
-    data: dict[str, Any] = dict(entry.data or {})
+    # Read-only views; diagnostics never mutate entry data or options.
+    options: Mapping[str, Any] = entry.options or {}
+    data: Mapping[str, Any] = entry.data or {}
     runtime = cast(PollenLevelsRuntimeData | None, getattr(entry, "runtime_data", None))
     raw_lang = options.get(CONF_LANGUAGE_CODE, data.get(CONF_LANGUAGE_CODE))
     lang = normalize_language_code(raw_lang)
@@ -286,6 +347,7 @@ async def async_get_config_entry_diagnostics(
         coordinate_pairs.append((data.get(CONF_LATITUDE), data.get(CONF_LONGITUDE)))
     coordinate_pairs.extend(_coordinate_pairs_from_location_subentries(entry))
     if runtime is not None:
+        redacted_key = redact_api_key(api_key, api_key_text) or "***"
         active_subentry_ids = active_location_subentry_ids(entry)
         filter_stale_locations = bool(
             active_subentry_ids
@@ -312,26 +374,20 @@ async def async_get_config_entry_diagnostics(
                 continue
             coordinator = location.coordinator
             lat, lon = runtime_coords.get(subentry_id, (None, None))
-            request_params_example: dict[str, Any] = {
-                "key": redact_api_key(api_key, api_key_text) or "***",
-                "location.latitude": _rounded(lat),
-                "location.longitude": _rounded(lon),
-                "days": FORECAST_DAYS,
-            }
-            if lang:
-                request_params_example["languageCode"] = lang
+            lat_rounded = _rounded(lat)
+            lon_rounded = _rounded(lon)
             location_payload = _coordinator_diagnostics(coordinator)
             location_payload["title"] = _redact_diagnostics_text(
                 getattr(coordinator, "entry_title", DEFAULT_ENTRY_TITLE),
                 api_key_text,
                 coordinate_pairs,
             )
-            location_payload["approximate_location"] = {
-                "label": "approximate_location (rounded)",
-                "latitude_rounded": _rounded(lat),
-                "longitude_rounded": _rounded(lon),
-            }
-            location_payload["request_params_example"] = request_params_example
+            location_payload["approximate_location"] = _approximate_location(
+                lat_rounded, lon_rounded
+            )
+            location_payload["request_params_example"] = _request_params_example(
+                redacted_key, lat_rounded, lon_rounded, lang
+            )
             locations[subentry_id] = location_payload
 
         runtime_failed_locations = getattr(runtime, "failed_locations", {}) or {}
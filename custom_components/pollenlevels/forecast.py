@@ -10,6 +10,29 @@ from __future__ import annotations
 from typing import Any
 
 
+def _set_convenience(
+    base: dict[str, Any],
+    forecast_by_offset: dict[Any, dict[str, Any]],
+    prefix: str,
+    off: int,
+) -> None:
+    """Set the ``<prefix>_*`` convenience fields for one forecast offset."""
+    f = forecast_by_offset.get(off)
+    has_index = f.get("has_index") if f else False
+    if has_index:
+        value = f.get("value")
+        category = f.get("category")
+        description = f.get("description")
+        color_hex = f.get("color_hex")
+    else:
+        value = category = description = color_hex = None
+    base[f"{prefix}_has_index"] = has_index
+    base[f"{prefix}_value"] = value
+    base[f"{prefix}_category"] = category
+    base[f"{prefix}_description"] = description
+    base[f"{prefix}_color_hex"] = color_hex
+
+
 def attach_forecast_attributes(
     base: dict[str, Any],
     forecast_list: list[dict[str, Any]],
@@ -30,22 +53,8 @@ def attach_forecast_attributes(
     base["forecast"] = forecast_list
     forecast_by_offset = {item.get("offset"): item for item in forecast_list}
 
-    def _set_convenience(prefix: str, off: int) -> None:
-        f = forecast_by_offset.get(off)
-        base[f"{prefix}_has_index"] = f.get("has_index") if f else False
-        base[f"{prefix}_value"] = f.get("value") if f and f.get("has_index") else None
-        base[f"{prefix}_category"] = (
-            f.get("category") if f and f.get("has_index") else None
-        )
-        base[f"{prefix}_description"] = (
-            f.get("description") if f and f.get("has_index") else None
-        )
-        base[f"{prefix}_color_hex"] = (
-            f.get("color_hex") if f and f.get("has_index") else None
-        )
-
-    _set_convenience("tomorrow", 1)
-    _set_convenience("d2", 2)
+    _set_convenience(base, forecast_by_offset, "tomorrow", 1)
+    _set_convenience(base, forecast_by_offset, "d2", 2)
 
     # Trend (today vs tomorrow)
     now_val = current_value if current_value is not None else base.get("value")
@@ -61,11 +70,16 @@ def attach_forecast_attributes(
         base["trend"] = None
 
     # Expected peak (excluding today)
-    peak = None
-    for f in forecast_list:
-        if f.get("has_index") and isinstance(f.get("value"), (int, float)):
-            if peak is None or f["value"] > peak["value"]:
-                peak = f
+    # max() keeps the first of equal values, matching the earliest-day peak.
+    peak = max(
+        (
+            f
+            for f in forecast_list
+            if f.get("has_index") and isinstance(f.get("value"), (int, float))
+        ),
+        key=lambda f: f["value"],
+        default=None,
+    )
     base["expected_peak"] = (
         {
             "offset": peak["offset"],
@@ -96,25 +96,35 @@ TYPE_ICONS = {
 PLANT_TYPE_ICONS = TYPE_ICONS
 DEFAULT_ICON = "mdi:flower-pollen"
 
+# Coordinator keys backed by dedicated meta sensors instead of PollenSensor.
+_META_SENSOR_KEYS = frozenset({"region", "date"})
+
+# Device translation keys per sensor group ("meta" also covers unknown groups).
+_DEVICE_TRANSLATION_KEYS = {"type": "types", "plant": "plants", "meta": "info"}
+
 
 async def _remove_legacy_per_day_entities(
     hass: HomeAssistant,
     entry_id: str,
-    identity_id: str,
+    *identity_ids: str,
 ) -> tuple[int, int]:
-    """Remove legacy per-day type forecast entities from the Entity Registry."""
+    """Remove legacy per-day type forecast entities from the Entity Registry.
+
+    All location identities of the entry are matched in a single registry pass.
+    """
+    if not identity_ids:
+        return 0, 0
+    prefixes = tuple(f"{identity_id}_" for identity_id in identity_ids)
     registry = er.async_get(hass)
     entries = er.async_entries_for_config_entry(registry, entry_id)
     found = 0
     removed = 0
 
     def _matches(uid: Any) -> bool:
-        """Check if a unique_id belongs to this identity and is legacy per-day."""
+        """Check if a unique_id belongs to these identities and is legacy per-day."""
         if not isinstance(uid, str):
             return False
-        if not uid.startswith(f"{identity_id}_"):
-            return False
-        return uid.endswith(("_d1", "_d2"))
+        return uid.endswith(("_d1", "_d2")) and uid.startswith(prefixes)
 
     removals: list[tuple[str, str, Awaitable[Any]]] = []
 
@@ -194,18 +204,16 @@ async def async_setup_entry(
     active_subentry_ids, filter_stale_locations = stale_runtime_location_filter(
         config_entry
     )
-    legacy_entities_found = False
-    for location in runtime.locations.values():
-        identity_id = coordinator_identity_id(location.coordinator)
-        (
-            found_legacy_entities,
-            _removed_legacy_entities,
-        ) = await _remove_legacy_per_day_entities(
+    legacy_entities_found, _removed_legacy_entities = (
+        await _remove_legacy_per_day_entities(
             hass,
             config_entry.entry_id,
-            identity_id,
+            *(
+                coordinator_identity_id(location.coordinator)
+                for location in runtime.locations.values()
+            ),
         )
-        legacy_entities_found = legacy_entities_found or found_legacy_entities
+    )
 
     if legacy_entities_found:
         create_per_day_forecast_sensors_removed_issue(hass)
@@ -234,7 +242,7 @@ async def async_setup_entry(
 
         sensors: list[CoordinatorEntity] = []
         for code in data:
-            if code in ("region", "date"):
+            if code in _META_SENSOR_KEYS:
                 continue
             if code.endswith(("_d1", "_d2")):
                 continue
@@ -292,6 +300,24 @@ class PollenSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = (
             f"{coordinator_identity_id(self.coordinator)}_{self.code}"
         )
+        # The device group follows the sensor key, so device info (including
+        # the formatted coordinates) is built once instead of on every access.
+        info = (coordinator.data or {}).get(code) or {}
+        group = info.get("source")
+        if not group:
+            if code.startswith("type_"):
+                group = "type"
+            elif code.startswith(("plant_", "plants_")):
+                group = "plant"
+            else:
+                group = "meta"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator_device_id(coordinator, group))},
+            "manufacturer": "Google",
+            "model": "Pollen API",
+            "translation_key": _DEVICE_TRANSLATION_KEYS.get(group, "info"),
+            "translation_placeholders": device_translation_placeholders(coordinator),
+        }
 
     @property
     def name(self) -> str:
@@ -376,32 +402,6 @@ class PollenSensor(CoordinatorEntity, SensorEntity):
 
         return attrs
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device info with translation support for the group."""
-        info = self.coordinator.data.get(self.code, {}) or {}
-        group = info.get("source")
-        if not group:
-            if self.code.startswith("type_"):
-                group = "type"
-            elif self.code.startswith(("plant_", "plants_")):
-                group = "plant"
-            else:
-                group = "meta"
-
-        device_id = coordinator_device_id(self.coordinator, group)
-        translation_keys = {"type": "types", "plant": "plants", "meta": "info"}
-        translation_key = translation_keys.get(group, "info")
-        return {
-            "identifiers": {(DOMAIN, device_id)},
-            "manufacturer": "Google",
-            "model": "Pollen API",
-            "translation_key": translation_key,
-            "translation_placeholders": device_translation_placeholders(
-                self.coordinator
-            ),
-        }
-
 
 class _BaseSummarySensor(CoordinatorEntity, SensorEntity):
     """Provide base behavior for daily summary sensors."""
@@ -414,12 +414,11 @@ class _BaseSummarySensor(CoordinatorEntity, SensorEntity):
         self.coordinator = coordinator
 
         device_id = coordinator_device_id(self.coordinator, group)
-        translation_keys = {"type": "types", "plant": "plants"}
         self._attr_device_info = {
             "identifiers": {(DOMAIN, device_id)},
             "manufacturer": "Google",
             "model": "Pollen API",
-            "translation_key": translation_keys[group],
+            "translation_key": _DEVICE_TRANSLATION_KEYS[group],
             "translation_placeholders": device_translation_placeholders(
                 self.coordinator
             ),
@@ -32,13 +32,6 @@ LEGACY_FORECAST_OPTION_KEYS = frozenset(
     }
 )
 LEGACY_ACTIVE_PER_DAY_SENSOR_MODES = frozenset({"D+1", "D+1+2"})
-_LANGUAGE_CODE_RE = re.compile(
-    r"^[A-Za-z]{2,3}"
-    r"(?:-[A-Za-z]{4})?"
-    r"(?:-(?:[A-Za-z]{2}|\d{3}))?"
-    r"(?:-(?:[A-Za-z0-9]{5,8}|\d[A-Za-z0-9]{3}))?$",
-    re.IGNORECASE,
-)
 
 
 def strip_legacy_forecast_options(
@@ -161,12 +154,45 @@ def device_subentry_ids(device: Any, entry_id: str) -> set[str | None] | None:
     return None
 
 
+def _is_language_tag(value: str) -> bool:
+    """Return whether ASCII *value* is language[-script][-region][-variant].
+
+    Subtag shapes are disjoint, so a greedy left-to-right scan is exact:
+    language 2-3 letters, script 4 letters, region 2 letters or 3 digits,
+    variant 5-8 alphanumerics or a digit followed by 3 alphanumerics.
+    """
+    subtags = value.split("-")
+    count = len(subtags)
+    if count > 4:
+        return False
+    language = subtags[0]
+    if not (2 <= len(language) <= 3 and language.isalpha()):
+        return False
+
+    index = 1
+    if index < count and len(subtags[index]) == 4 and subtags[index].isalpha():
+        index += 1
+    if index < count:
+        region = subtags[index]
+        if (len(region) == 2 and region.isalpha()) or (
+            len(region) == 3 and region.isdigit()
+        ):
+            index += 1
+    if index < count:
+        variant = subtags[index]
+        if variant.isalnum() and (
+            5 <= len(variant) <= 8 or (len(variant) == 4 and variant[0].isdigit())
+        ):
+            index += 1
+    return index == count
+
+
 def normalize_language_code(value: object) -> str | None:
     """Return a normalized BCP-47-like language code, or None when invalid."""
     if not isinstance(value, str):
         return None
     normalized = value.strip()
-    if not normalized or not _LANGUAGE_CODE_RE.match(normalized):
+    if not normalized or not normalized.isascii() or not _is_language_tag(normalized):
         return None
     return normalized
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 from types import ModuleType
@@ -216,10 +217,11 @@ def stub_selector_module(
 
 
 def stub_util_dt_module(*, monkeypatch: pytest.MonkeyPatch | None = None) -> ModuleType:
-    """Install lightweight ``homeassistant.util`` and ``homeassistant.util.dt`` stubs."""
+    """Install lightweight ``homeassistant.util`` with ``dt`` and ``json`` stubs."""
 
     util_mod = ModuleType("homeassistant.util")
     dt_mod = ModuleType("homeassistant.util.dt")
+    json_mod = ModuleType("homeassistant.util.json")
 
     def _stub_utcnow():
         from datetime import UTC, datetime
@@ -248,8 +250,11 @@ def stub_util_dt_module(*, monkeypatch: pytest.MonkeyPatch | None = None) -> Mod
 
     dt_mod.utcnow = _stub_utcnow
     dt_mod.parse_http_date = _stub_parse_http_date
+    json_mod.json_loads = json.loads
     util_mod.dt = dt_mod
+    util_mod.json = json_mod
     _set_module("homeassistant.util", util_mod, monkeypatch=monkeypatch)
+    _set_module("homeassistant.util.json", json_mod, monkeypatch=monkeypatch)
     return _set_module("homeassistant.util.dt", dt_mod, monkeypatch=monkeypatch)
 
 
@@ -78,10 +78,13 @@ class FakeResponse:
         self.headers: dict[str, str] = {}
         self._json_results = list(json_results or [])
         self._text_body = text_body
+        self.json_kwargs: list[dict[str, Any]] = []
+        self.exited = False
 
     async def json(self, *args: Any, **kwargs: Any) -> Any:
         """Return or raise the next configured JSON result."""
 
+        self.json_kwargs.append(kwargs)
         if not self._json_results:
             return {}
 
@@ -103,6 +106,7 @@ class FakeResponse:
     async def __aexit__(self, exc_type, exc: BaseException | None, tb) -> None:
         """Support the async context manager protocol."""
 
+        self.exited = True
         return None
 
 
@@ -173,6 +177,21 @@ async def test_client_invalid_json_raises_update_failed(
         await _fetch_with_response(client_module, response)
 
 
+@pytest.mark.asyncio
+async def test_client_decodes_success_body_with_home_assistant_json_loader(
+    client_module: ModuleType,
+) -> None:
+    """Successful responses should be decoded with Home Assistant's JSON loader."""
+
+    response = FakeResponse(json_results=[{"dailyInfo": []}])
+
+    await _fetch_with_response(client_module, response)
+
+    assert response.json_kwargs == [
+        {"content_type": None, "loads": client_module.json_loads}
+    ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("payload", [[], "not an object", 1, None])
 async def test_client_non_object_json_raises_update_failed(
@@ -370,3 +389,67 @@ async def test_client_treats_400_non_auth_error_as_update_failed(
 
     with pytest.raises(client_module.UpdateFailed, match="HTTP 400"):
         await _fetch_with_response(client_module, response)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 503])
+async def test_client_releases_response_before_retry_sleep(
+    client_module: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    status: int,
+) -> None:
+    """Retryable statuses should leave the response context before sleeping."""
+
+    failed = FakeResponse(status=status)
+    succeeded = FakeResponse(json_results=[{"dailyInfo": []}])
+    responses = [failed, succeeded]
+    exited_at_sleep: list[bool] = []
+
+    class _SequenceSession:
+        def get(self, *_args: Any, **_kwargs: Any) -> FakeResponse:
+            return responses.pop(0)
+
+    async def _fake_sleep(_delay: float) -> None:
+        exited_at_sleep.append(failed.exited)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", _fake_sleep)
+
+    client = client_module.GooglePollenApiClient(_SequenceSession(), "test")
+    payload = await client.async_fetch_pollen_data(
+        latitude=1.0, longitude=2.0, days=5, language_code=None
+    )
+
+    assert payload == {"dailyInfo": []}
+    assert exited_at_sleep == [True]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error_kind", ["timeout", "client_error"])
+async def test_client_retries_transport_errors_with_backoff(
+    client_module: ModuleType,
+    monkeypatch: pytest.MonkeyPatch,
+    error_kind: str,
+) -> None:
+    """Timeouts and network errors should share the jittered backoff path."""
+
+    error: Exception = (
+        TimeoutError()
+        if error_kind == "timeout"
+        else client_module.ClientError("connection reset")
+    )
+    delays: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", _fake_sleep)
+    monkeypatch.setattr(client_module.random, "random", lambda: 0.0)
+
+    client = client_module.GooglePollenApiClient(RaisingSession(error), "test")
+    with pytest.raises(client_module.UpdateFailed):
+        await client.async_fetch_pollen_data(
+            latitude=1.0, longitude=2.0, days=5, language_code=None
+        )
+
+    expected = [0.8 * (2**attempt) for attempt in range(client_module.MAX_RETRIES)]
+    assert delays == expected
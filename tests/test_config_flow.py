@@ -1829,6 +1829,36 @@ def test_validate_input_happy_path_normalizes(
     assert normalized[config_flow_stubs.CONF_LANGUAGE_CODE] == "es"
 
 
+@pytest.mark.parametrize("api_key", ["test key", "test\tkey", "test\x00key"])
+def test_validate_input_rejects_malformed_api_key_without_request(
+    config_flow_stubs: ConfigFlowStubs,
+    monkeypatch: pytest.MonkeyPatch,
+    api_key: str,
+) -> None:
+    """Keys with inner whitespace or control characters should fail locally."""
+
+    calls = _patch_client_fetch(config_flow_stubs, monkeypatch)
+
+    flow = config_flow_stubs.PollenLevelsConfigFlow()
+    flow.hass = SimpleNamespace(config=SimpleNamespace())
+    placeholders: dict[str, str] = {}
+
+    errors, normalized = asyncio.run(
+        flow._async_validate_input(
+            {
+                **_base_user_input(config_flow_stubs),
+                config_flow_stubs.CONF_API_KEY: api_key,
+            },
+            description_placeholders=placeholders,
+        )
+    )
+
+    assert errors == {"base": "invalid_auth"}
+    assert normalized is None
+    assert calls == []
+    assert placeholders["error_message"] == ""
+
+
 @pytest.mark.parametrize(
     ("step_method_name", "entry_getter"),
     [
@@ -2113,7 +2143,8 @@ def test_reconfigure_api_key_error_uses_failing_location_placeholders(
         config_entries=SimpleNamespace(
             async_get_entry=lambda entry_id: (
                 entry if entry_id == entry.entry_id else None
-            )
+            ),
+            async_entry_for_domain_unique_id=lambda domain, unique_id: None,
         )
     )
     flow.context = {"entry_id": entry.entry_id}
@@ -2183,6 +2214,7 @@ def test_reconfigure_api_key_validation_stops_on_invalid_auth(
             async_get_entry=lambda entry_id: (
                 entry if entry_id == entry.entry_id else None
             ),
+            async_entry_for_domain_unique_id=lambda domain, unique_id: None,
             async_update_entry=lambda *args, **kwargs: None,
             async_reload=lambda *args, **kwargs: None,
         )
@@ -2211,6 +2243,66 @@ def test_reconfigure_api_key_validation_stops_on_invalid_auth(
     assert attempts == 1
 
 
+def test_reconfigure_rejects_duplicate_api_key_before_validation(
+    config_flow_stubs: ConfigFlowStubs,
+) -> None:
+    """Another parent's key should be rejected without validating locations."""
+
+    location = config_flow_stubs.config_flow.config_entries.ConfigSubentry(
+        data={
+            config_flow_stubs.CONF_LATITUDE: 1.0,
+            config_flow_stubs.CONF_LONGITUDE: 2.0,
+        },
+        subentry_id="subentry-1",
+        title="First",
+        unique_id="1.0000_2.0000",
+    )
+    entry = config_flow_stubs.config_flow.config_entries.ConfigEntry(
+        data={config_flow_stubs.CONF_API_KEY: "old-key"},
+        entry_id="entry-id",
+        subentries={location.subentry_id: location},
+    )
+    duplicate = SimpleNamespace(entry_id="duplicate-entry-id")
+    taken_unique_id = config_flow_stubs.config_flow._api_key_unique_id("taken-key")
+
+    flow = config_flow_stubs.PollenLevelsConfigFlow()
+    flow.hass = SimpleNamespace(
+        config_entries=SimpleNamespace(
+            async_get_entry=lambda entry_id: (
+                entry if entry_id == entry.entry_id else None
+            ),
+            async_entry_for_domain_unique_id=lambda domain, unique_id: (
+                duplicate if unique_id == taken_unique_id else None
+            ),
+        )
+    )
+    flow.context = {"entry_id": "entry-id"}
+    flow.async_show_form = (  # type: ignore[method-assign]
+        lambda *args, **kwargs: {
+            "step_id": kwargs.get("step_id") or (args[0] if args else None),
+            "errors": kwargs.get("errors") or {},
+        }
+    )
+    attempts = 0
+
+    async def fake_validate(user_input, *, description_placeholders=None):
+        nonlocal attempts
+        attempts += 1
+        return {}, None
+
+    flow._async_validate_input = fake_validate  # type: ignore[assignment]
+
+    result = asyncio.run(
+        flow.async_step_reconfigure({config_flow_stubs.CONF_API_KEY: " taken-key "})
+    )
+
+    assert result == {
+        "step_id": "reconfigure",
+        "errors": {"base": "api_key_already_configured"},
+    }
+    assert attempts == 0
+
+
 def test_reauth_confirm_does_not_reintroduce_option_fields_in_data(
     config_flow_stubs: ConfigFlowStubs,
 ) -> None:
@@ -2448,7 +2540,10 @@ def test_async_step_user_checks_api_key_unique_id(
         config_flow_stubs.CONF_LANGUAGE_CODE: "en",
     }
 
+    validate_calls: list[dict] = []
+
     async def fake_validate(user_input, *, description_placeholders=None):
+        validate_calls.append(user_input)
         return {}, normalized
 
     flow._async_validate_input = fake_validate  # type: ignore[assignment]
@@ -2456,12 +2551,13 @@ def test_async_step_user_checks_api_key_unique_id(
     result = asyncio.run(
         flow.async_step_user(
             {
-                config_flow_stubs.CONF_API_KEY: "shared-key",
+                config_flow_stubs.CONF_API_KEY: " shared-key ",
             }
         )
     )
 
     assert result == {"type": "abort", "reason": "api_key_already_configured"}
+    assert validate_calls == []
     assert flow.unique_ids == [duplicate_unique_id]
     assert lookup_calls == [(config_flow_stubs.config_flow.DOMAIN, duplicate_unique_id)]
 
@@ -1880,6 +1880,8 @@ def test_plant_sensor_preserves_future_health_recommendations_if_present(
         ({"date": {"year": "bad", "month": 6, "day": 1}}, None),
         ({"date": {"year": 2025.5, "month": 6, "day": 1}}, None),
         ({"date": {"year": True, "month": 6, "day": 1}}, None),
+        ({"date": {"year": 2025, "month": 2, "day": 30}}, None),
+        ({"date": {"year": 2025, "month": 13, "day": 1}}, None),
     ],
 )
 def test_extract_api_date_parses_integer_like_values(
@@ -2323,6 +2325,63 @@ def test_remove_legacy_per_day_entities_removes_only_matching_legacy_entities(
     ]
 
 
+def test_remove_legacy_per_day_entities_matches_all_identities_in_one_pass(
+    sensor_modules: SensorModules,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """One cleanup call handles every location identity of the entry."""
+
+    entries = [
+        RegistryEntry(
+            "sensor.home_grass_d1",
+            "entry_home_type_grass_d1",
+            "sensor",
+            sensor_modules.sensor.DOMAIN,
+        ),
+        RegistryEntry(
+            "sensor.work_tree_d2",
+            "entry_work_type_tree_d2",
+            "sensor",
+            sensor_modules.sensor.DOMAIN,
+        ),
+        RegistryEntry(
+            "sensor.work_tree",
+            "entry_work_type_tree",
+            "sensor",
+            sensor_modules.sensor.DOMAIN,
+        ),
+    ]
+    registry = _setup_registry_stub(
+        sensor_modules, monkeypatch, entries, entry_id="entry"
+    )
+    calls = 0
+    entries_for_config_entry = registry.async_entries_for_config_entry
+
+    def _counting_entries(registry_obj, entry_id: str):
+        nonlocal calls
+        calls += 1
+        return entries_for_config_entry(registry_obj, entry_id)
+
+    monkeypatch.setattr(
+        sensor_modules.sensor.er, "async_entries_for_config_entry", _counting_entries
+    )
+
+    loop = asyncio.new_event_loop()
+    hass = DummyHass(loop)
+    try:
+        found, removed = loop.run_until_complete(
+            sensor_modules.sensor._remove_legacy_per_day_entities(
+                hass, "entry", "entry_home", "entry_work"
+            )
+        )
+    finally:
+        loop.close()
+
+    assert calls == 1
+    assert (found, removed) == (2, 2)
+    assert registry.removals == ["sensor.home_grass_d1", "sensor.work_tree_d2"]
+
+
 def test_remove_legacy_per_day_entities_logs_failed_removal_without_raising(
     sensor_modules: SensorModules,
     monkeypatch: pytest.MonkeyPatch,
@@ -2778,9 +2837,7 @@ def test_coordinator_retries_then_raises_on_server_errors(
         delays.append(delay)
 
     monkeypatch.setattr(sensor_modules.client_mod.asyncio, "sleep", _fast_sleep)
-    monkeypatch.setattr(
-        sensor_modules.client_mod.random, "uniform", lambda *_args, **_kwargs: 0.0
-    )
+    monkeypatch.setattr(sensor_modules.client_mod.random, "random", lambda: 0.0)
 
     client = sensor_modules.client_mod.GooglePollenApiClient(session, "test")
 
@@ -2810,9 +2867,7 @@ def test_coordinator_retries_then_wraps_timeout(
         delays.append(delay)
 
     monkeypatch.setattr(sensor_modules.client_mod.asyncio, "sleep", _fast_sleep)
-    monkeypatch.setattr(
-        sensor_modules.client_mod.random, "uniform", lambda *_args, **_kwargs: 0.0
-    )
+    monkeypatch.setattr(sensor_modules.client_mod.random, "random", lambda: 0.0)
 
     client = sensor_modules.client_mod.GooglePollenApiClient(session, "test")
 
@@ -2847,9 +2902,7 @@ def test_coordinator_retries_then_wraps_client_error(
         delays.append(delay)
 
     monkeypatch.setattr(sensor_modules.client_mod.asyncio, "sleep", _fast_sleep)
-    monkeypatch.setattr(
-        sensor_modules.client_mod.random, "uniform", lambda *_args, **_kwargs: 0.0
-    )
+    monkeypatch.setattr(sensor_modules.client_mod.random, "random", lambda: 0.0)
 
     client = sensor_modules.client_mod.GooglePollenApiClient(session, "secret")
 
@@ -134,8 +134,8 @@ def _extract_sensor_translation_key_usage() -> tuple[set[str], set[str]]:
 
     Device keys:
       - "translation_key": "<key>" in a device_info dict literal
-      - values in a mapping like: translation_keys = {"type": "types", ...}
-      - default used in translation_keys.get(..., "<default>")
+      - values in a mapping like: _DEVICE_TRANSLATION_KEYS = {"type": "types", ...}
+      - default used in _DEVICE_TRANSLATION_KEYS.get(..., "<default>")
 
     This stays intentionally narrow; unsupported AST changes should fail loudly.
     """
@@ -183,25 +183,31 @@ def _extract_sensor_translation_key_usage() -> tuple[set[str], set[str]]:
             ):
                 device_keys.add(v.value)
 
-    # 3) Device translation keys from a mapping: translation_keys = {...}
+    # 3) Device translation keys from a mapping: _DEVICE_TRANSLATION_KEYS = {...}
+    mapping_found = False
     for node in ast.walk(tree):
         if not isinstance(node, ast.Assign) or len(node.targets) != 1:
             continue
         if not (
             isinstance(node.targets[0], ast.Name)
-            and node.targets[0].id == "translation_keys"
+            and node.targets[0].id == "_DEVICE_TRANSLATION_KEYS"
         ):
             continue
+        mapping_found = True
         if not isinstance(node.value, ast.Dict):
-            _fail_unexpected_ast("sensor.py translation_keys assignment is not a dict")
+            _fail_unexpected_ast(
+                "sensor.py _DEVICE_TRANSLATION_KEYS assignment is not a dict"
+            )
         for v in node.value.values:
             if not (isinstance(v, ast.Constant) and isinstance(v.value, str)):
                 _fail_unexpected_ast(
-                    "sensor.py translation_keys dict contains non-string values"
+                    "sensor.py device key mapping contains non-string values"
                 )
             device_keys.add(v.value)
+    if not mapping_found:
+        _fail_unexpected_ast("sensor.py device translation key mapping not found")
 
-    # 4) Default device translation key: translation_keys.get(..., "<default>")
+    # 4) Default device key: _DEVICE_TRANSLATION_KEYS.get(..., "<default>")
     for node in ast.walk(tree):
         if not isinstance(node, ast.Call):
             continue
@@ -209,7 +215,7 @@ def _extract_sensor_translation_key_usage() -> tuple[set[str], set[str]]:
             continue
         if not (
             isinstance(node.func.value, ast.Name)
-            and node.func.value.id == "translation_keys"
+            and node.func.value.id == "_DEVICE_TRANSLATION_KEYS"
         ):
             continue
         if len(node.args) >= 2:
@@ -218,7 +224,7 @@ def _extract_sensor_translation_key_usage() -> tuple[set[str], set[str]]:
                 device_keys.add(default.value)
             else:
                 _fail_unexpected_ast(
-                    "sensor.py translation_keys.get default is not a string literal"
+                    "sensor.py device key mapping default is not a string literal"
                 )
 
     return entity_keys, device_keys
@@ -482,9 +482,18 @@ def test_device_subentry_ids_mapping_for_matching_entry(util_module):
         ("", None),
         (None, None),
         ("bad code", None),
+        ("es-419", "es-419"),
+        ("sl-Latn-IT-rozaj", "sl-Latn-IT-rozaj"),
+        ("de-1996", "de-1996"),
+        ("en-", None),
+        ("en--US", None),
+        ("en-US-US", None),
+        ("es-\u0664\u0661\u0669", None),
+        ("\u00e9s", None),
     ],
 )
 def test_normalize_language_code(util_module, value, expected):
     """Language codes should share one validation path for flow and runtime use."""
 
     assert util_module.normalize_language_code(value) == expected
+